@@ -6,7 +6,16 @@ import yaml
 import argparse
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re 
+import json
+import mmap
+import functools
+import shutil
+import tempfile
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 # Suppress pydantic warnings from ATProto
 warnings.filterwarnings("ignore", module="pydantic")
@@ -14,91 +23,214 @@ warnings.filterwarnings("ignore", message=".*The 'default' attribute with value
 
 from dotenv import load_dotenv
 from atproto import Client, models, client_utils
-from mastodon import Mastodon
+from mastodon import Mastodon, MastodonNetworkError, MastodonServerError
+from tenacity import retry, retry_if_exception, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+
+# Prefer the libyaml C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
 # --- CONFIGURATION ---
 load_dotenv()
 
 BASE_URL = os.getenv("BASE_URL")
+SITE_ROOT = (BASE_URL or "https://example.com").rstrip("/")
 
 # Bluesky configuration
 BSKY_HANDLE = os.getenv("BSKY_HANDLE")
 BSKY_PASSWORD = os.getenv("BSKY_PASSWORD")
 BSKY_CHAR_LIMIT = 290
+BSKY_BATCH_SIZE = 200 # applyWrites accepts at most 200 writes per call
 
 # Mastodon configuration
 MASTODON_ACCESS_TOKEN = os.getenv("MASTODON_ACCESS_TOKEN")
 MASTODON_API_BASE = os.getenv("MASTODON_API_BASE")
 MASTODON_CHAR_LIMIT = 490 
 
+# Posting retries (transient failures only)
+POST_ATTEMPTS = 4
+BSKY_RETRY_STATUSES = (429, 503)
+
+# Scanning configuration
+FRONTMATTER_READ_SIZE = 8192
+SCAN_CACHE_FILE = ".posse-cache.json"
+IGNORE_FILE = ".posseignore"
+SYNDICATED_PATTERN = re.compile(rb"^syndicated\s*[:=]\s*(?i:true)\b", re.M)
+RICHTEXT_PATTERN = re.compile(r'(https?://\S+|#[a-zA-Z0-9_]+)')
+
+# Network configuration
+VERIFY_WORKERS = 16
+
+# One pooled session for URL checks, so posts on the same host reuse connections
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.headers.update({'User-Agent': 'Mozilla/5.0 (SyndicationScript)'})
+_adapter = HTTPAdapter(
+    pool_connections=VERIFY_WORKERS,
+    pool_maxsize=VERIFY_WORKERS * 2,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+)
+HTTP_SESSION.mount("https://", _adapter)
+HTTP_SESSION.mount("http://", _adapter)
+
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 
 # --- Content Handling ---
+@functools.lru_cache(maxsize=4096)
+def load_frontmatter_block(block, fmt):
+    """Parses a raw front matter block. Results are shared, so treat them as read-only."""
+    if fmt == "toml":
+        return tomllib.loads(block.decode("utf-8"))
+    return yaml.load(block, Loader=YamlLoader)
+
 def parse_frontmatter(content):
+    """Parses front matter from raw file bytes; only the front matter slice is decoded."""
     try:
-        if content.startswith("+++"):
-            end = content.find("+++", 3)
-            return tomllib.loads(content[3:end])
-        elif content.startswith("---"):
-            end = content.find("---", 3)
-            return yaml.safe_load(content[3:end])
+        if content.startswith(b"+++"):
+            end = content.find(b"+++", 3)
+            return load_frontmatter_block(content[3:end], "toml")
+        elif content.startswith(b"---"):
+            end = content.find(b"---", 3)
+            return load_frontmatter_block(content[3:end], "yaml")
     except Exception as e:
-        logging.error(f"Parsing error: {e}")
+        logging.error("Parsing error: %s", e)
     return None
 
+def read_frontmatter_block(filepath, buf=None):
+    """
+    Reads only as much of the file as needed to cover the front matter.
+    Returns None if the file doesn't open with a front matter delimiter.
+
+    The first read lands in buf (a bytearray), so the scan loop can share
+    one buffer; most front matter fits in it and only that slice is copied out.
+    Returns raw bytes; decoding is left to parse_frontmatter.
+    """
+    if buf is None:
+        buf = bytearray(FRONTMATTER_READ_SIZE)
+    view = memoryview(buf)
+
+    with open(filepath, "rb", buffering=0) as f:
+        n = f.readinto(buf)
+        delimiter = bytes(view[:3])
+        if n < 3 or delimiter not in (b"+++", b"---"):
+            return None
+
+        end = buf.find(delimiter, 3, n)
+        if end != -1:
+            return bytes(view[:end + 3])
+
+        # Front matter is bigger than the buffer; map the file and search it
+        # in place so only the front matter itself gets copied out
+        if n < len(buf):
+            return bytes(view[:n])
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = mm.find(delimiter, 3)
+            if end == -1:
+                return mm[:]
+            return mm[:end + 3]
+
+def iter_markdown_files(path):
+    """
+    Recursively yields os.DirEntry objects for .md files under path.
+    Directories containing a .posseignore file are skipped entirely.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError as e:
+        logging.warning("Could not scan %s: %s", path, e)
+        return
+
+    if any(entry.name == IGNORE_FILE for entry in entries):
+        return
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from iter_markdown_files(entry.path)
+        elif entry.name.endswith(".md") and entry.is_file():
+            yield entry
+
+def load_scan_cache(cache_path):
+    """
+    Loads the scan cache: {filepath: {"mtime", "syndicated", "syndicate_to"}}.
+    A missing or unreadable cache just means every file gets scanned.
+    """
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if isinstance(cache, dict):
+            return cache
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logging.warning("Ignoring scan cache %s: %s", cache_path, e)
+    return {}
+
+def save_scan_cache(cache_path, cache):
+    try:
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=1, sort_keys=True)
+    except Exception as e:
+        logging.warning("Could not write scan cache %s: %s", cache_path, e)
+
 def get_post_url(filepath, frontmatter):
     """
     Constructs the public URL.
     Handles nested folders (content/blog/2025/11/post.md) correctly.
+    Expects an already normalized path (see main).
     """
-    root = BASE_URL if BASE_URL else "https://example.com"
-    root = root.rstrip("/")
-    
     # Normalize path separators to forward slashes for consistency
-    path_norm = os.path.normpath(filepath).replace("\\", "/")
-    path_parts = path_norm.split("/")
-    
-    try:
-        # Find 'content' and capture everything after it
-        content_idx = path_parts.index("content")
-        # e.g. ['blog', '2025', '11']
-        dirs = path_parts[content_idx + 1 : -1]
-    except ValueError:
-        dirs = ["posts"] # Fallback
-
-    filename = os.path.basename(filepath)
+    path_norm = "/" + filepath.replace(os.sep, "/")
+
+    # Capture everything after the first 'content' folder
+    # e.g. 'blog/2025/11' and 'post.md'
+    _, found, rest = path_norm.partition("/content/")
+    if found:
+        dirs, _, filename = rest.rpartition("/")
+    else:
+        dirs, filename = "posts", path_norm.rpartition("/")[2] # Fallback
     
     # Handle "Leaf Bundles" (folders with index.md)
     if filename == "index.md" or filename == "_index.md":
-        if frontmatter.get("slug"):
-            dirs[-1] = frontmatter.get("slug")
-        url_path = "/".join(dirs)
+        slug = frontmatter.get("slug")
+        if slug:
+            parent = dirs.rpartition("/")[0]
+            dirs = f"{parent}/{slug}" if parent else slug
+        url_path = dirs
     else:
         # Standard File
         slug = frontmatter.get("slug")
         if not slug:
             slug = os.path.splitext(filename)[0]
-        url_path = "/".join(dirs + [slug])
+        url_path = f"{dirs}/{slug}" if dirs else slug
 
-    return f"{root}/{url_path}/"
+    return f"{SITE_ROOT}/{url_path}/"
 
 def verify_url_accessible(url):
+    """
+    Checks the live URL without downloading the page body.
+    Falls back to a one-byte ranged GET for servers that refuse HEAD.
+    """
     try:
-        headers = {'User-Agent': 'Mozilla/5.0 (SyndicationScript)'}
-        response = requests.get(url, headers=headers, timeout=10)
+        response = HTTP_SESSION.head(url, timeout=10, allow_redirects=True)
+        if response.status_code in (403, 405):
+            with HTTP_SESSION.get(url, headers={'Range': 'bytes=0-0'}, stream=True, timeout=10) as response:
+                return response.status_code in (200, 206)
         return response.status_code == 200
     except requests.exceptions.RequestException as e:
-        logging.error(f"Connection failed for {url}: {e}")
+        logging.error("Connection failed for %s: %s", url, e)
         return False
 
 def truncate_text(title, content, limit, suffix=""):
     """Truncates content to fit limits, ensuring suffix is never chopped (for Mastodon)."""
-    suffix_padding = 2 if suffix else 0
-    reserved_chars = len(title) + 2 + len(suffix) + suffix_padding 
+    suffix_len = len(suffix)
+    suffix_padding = 2 if suffix_len else 0
+    reserved_chars = len(title) + 2 + suffix_len + suffix_padding 
     available_chars = limit - reserved_chars
     
     if available_chars <= 0:
-        return f"{title[:limit-len(suffix)-5]}... {suffix}"
+        return f"{title[:limit-suffix_len-5]}... {suffix}"
         
     final_content = ""
     if content:
@@ -120,8 +252,7 @@ def parse_to_bluesky_richtext(text):
     Parses a string, and returns a TextBuilder object with active hashtags and links.
     """
     builder = client_utils.TextBuilder()
-    pattern = r'(https?://\S+|#[a-zA-Z0-9_]+)'
-    parts = re.split(pattern, text)
+    parts = RICHTEXT_PATTERN.split(text)
 
     for part in parts:
         if not part: continue
@@ -141,83 +272,228 @@ def parse_to_bluesky_richtext(text):
     return builder
 
 # --- Syndication ---
-def syndicate_to_bluesky(client, frontmatter, url):
-    if not client: return False
-    
+def network_retry(condition):
+    """Retries a posting call with exponential backoff; the last error is re-raised."""
+    return retry(
+        retry=condition,
+        wait=wait_exponential_jitter(),
+        stop=stop_after_attempt(POST_ATTEMPTS),
+        reraise=True,
+    )
+
+def is_transient_bluesky_error(e):
+    """
+    Creates aren't idempotent, so only retry responses that mean nothing
+    was written (rate limited or server unavailable).
+    """
+    response = getattr(e, "response", None)
+    return getattr(response, "status_code", None) in BSKY_RETRY_STATUSES
+
+def is_rejected_bluesky_batch(e):
+    """
+    True only when the server refused the request (400 Bad Request), which
+    means the atomic batch wasn't written. Timeouts, network errors and 5xx
+    responses may arrive after the commit, so they don't count.
+    """
+    response = getattr(e, "response", None)
+    return getattr(response, "status_code", None) == 400
+
+@network_retry(retry_if_exception(is_transient_bluesky_error))
+def post_to_bluesky(client, writes):
+    client.com.atproto.repo.apply_writes(
+        models.ComAtprotoRepoApplyWrites.Data(repo=client.me.did, writes=writes)
+    )
+
+# The idempotency key makes Mastodon drop repeats, so any network or
+# server error is safe to retry
+@network_retry(retry_if_exception_type((MastodonNetworkError, MastodonServerError)))
+def post_to_mastodon(client, post_text, idempotency_key):
+    client.status_post(status=post_text, idempotency_key=idempotency_key)
+
+def prepare_post(frontmatter, url):
+    """Reads the shared fields once and builds the text for each network."""
     title = frontmatter.get("title", "New Post")
     text_content = frontmatter.get("microblog_content", "")
-    
-    raw_text = truncate_text(title, text_content, BSKY_CHAR_LIMIT)
-    rich_text = parse_to_bluesky_richtext(raw_text)
+
+    # Reserve chars for the URL
+    masto_limit = MASTODON_CHAR_LIMIT - len(url) - 2
+
+    return {
+        "title": title,
+        "content": text_content,
+        "bluesky": truncate_text(title, text_content, BSKY_CHAR_LIMIT),
+        "mastodon": truncate_text(title, text_content, masto_limit, suffix=url),
+    }
+
+def build_bluesky_post(client, post, url):
+    """Builds the post record. Nothing is sent until syndicate_to_bluesky."""
+    rich_text = parse_to_bluesky_richtext(post["bluesky"])
     
     external = models.AppBskyEmbedExternal.External(
-        title=title,
-        description=text_content[:200],
+        title=post["title"],
+        description=post["content"][:200],
         uri=url,
         thumb=None 
     )
     embed_card = models.AppBskyEmbedExternal.Main(external=external)
     
-    try:
-        client.send_post(text=rich_text, embed=embed_card)
-        logging.info(f"✅ Bluesky: Posted '{title}'")
-        return True
-    except Exception as e:
-        logging.error(f"❌ Bluesky Failed: {e}")
-        return False
+    return models.AppBskyFeedPost.Record(
+        text=rich_text.build_text(),
+        facets=rich_text.build_facets(),
+        embed=embed_card,
+        langs=["en"], # send_post's default
+        created_at=client.get_current_time_iso(),
+    )
 
-def syndicate_to_mastodon(client, frontmatter, url):
-    if not client: return False
+def syndicate_to_bluesky(client, posts):
+    """
+    Commits a batch of (title, record) posts with a single applyWrites call
+    and returns one result per post. The write is atomic, so if the server
+    rejects the batch the posts are sent one by one, keeping a single bad
+    record from failing the rest. Any other error may have come after the
+    commit, so the batch is failed without resending anything.
+    """
+    if not client: return [False] * len(posts)
 
-    title = frontmatter.get("title", "New Post")
-    text_content = frontmatter.get("microblog_content", "")
+    writes = [
+        models.ComAtprotoRepoApplyWrites.Create(collection=models.ids.AppBskyFeedPost, value=record)
+        for _, record in posts
+    ]
     
-    # Reserve chars for the URL
-    limit = MASTODON_CHAR_LIMIT - len(url) - 2
-    post_text = truncate_text(title, text_content, limit, suffix=url)
+    try:
+        post_to_bluesky(client, writes)
+        for title, _ in posts:
+            logging.info("✅ Bluesky: Posted '%s'", title)
+        return [True] * len(posts)
+    except Exception as e:
+        if len(posts) == 1 or not is_rejected_bluesky_batch(e):
+            logging.error("❌ Bluesky Failed: %s", e)
+            return [False] * len(posts)
+        logging.warning("Bluesky batch rejected (%s). Posting individually.", e)
+
+    results = []
+    for (title, _), write in zip(posts, writes):
+        try:
+            post_to_bluesky(client, [write])
+            logging.info("✅ Bluesky: Posted '%s'", title)
+            results.append(True)
+        except Exception as e:
+            logging.error("❌ Bluesky Failed for '%s': %s", title, e)
+            results.append(False)
+    return results
+
+def split_batch_future(batch_future, size):
+    """Gives each post in a batch its own future, resolved from the batch's per-post results."""
+    item_futures = [Future() for _ in range(size)]
+
+    def resolve(future):
+        try:
+            outcomes = future.result()
+        except Exception as e:
+            logging.error("❌ Bluesky Failed: %s", e)
+            outcomes = [False] * size
+        for item_future, ok in zip(item_futures, outcomes):
+            item_future.set_result(ok)
+
+    batch_future.add_done_callback(resolve)
+    return item_futures
+
+def syndicate_to_mastodon(client, post):
+    if not client: return False
     
     try:
-        client.status_post(status=post_text)
-        logging.info(f"✅ Mastodon: Posted '{title}'")
+        post_to_mastodon(client, post["mastodon"], uuid.uuid4().hex)
+        logging.info("✅ Mastodon: Posted '%s'", post["title"])
         return True
     except Exception as e:
-        logging.error(f"❌ Mastodon Failed: {e}")
+        logging.error("❌ Mastodon Failed: %s", e)
         return False
 
 def mark_syndicated(manifest_item):
+    """
+    Inserts the syndicated flag before the closing front matter delimiter.
+    Streams through a temp file and swaps it in, so the post body is never
+    held in memory and a failed write can't leave a half-written post.
+    """
     filepath = manifest_item["filepath"]
+    # Write to the real file so a symlinked post stays a symlink
+    target = os.path.realpath(filepath)
+    tmp_path = None
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-        
-        # Detect format based on the first line
-        is_toml = lines[0].strip() == "+++"
-        delimiter = "+++" if is_toml else "---"
-        
-        # Set the correct syntax for the boolean
-        # TOML uses '=', YAML uses ':'
-        syndicated_line = "syndicated = true\n" if is_toml else "syndicated: true\n"
-        
-        with open(filepath, "w", encoding="utf-8") as f:
-            found_closing = False
-            for i, line in enumerate(lines):
+        with open(target, "rb") as src:
+            first_line = src.readline()
+
+            # The scan records the format; only detect it for items without one
+            fmt = manifest_item.get("fmt")
+            if fmt is None:
+                fmt = "toml" if first_line.strip() == b"+++" else "yaml"
+            is_toml = fmt == "toml"
+            delimiter = b"+++" if is_toml else b"---"
+            newline = b"\r\n" if first_line.endswith(b"\r\n") else b"\n"
+
+            # Set the correct syntax for the boolean
+            # TOML uses '=', YAML uses ':'
+            syndicated_line = (b"syndicated = true" if is_toml else b"syndicated: true") + newline
+
+            with tempfile.NamedTemporaryFile("wb", dir=os.path.dirname(target), prefix=".posse-", delete=False) as tmp:
+                tmp_path = tmp.name
+                tmp.write(first_line)
+
                 # Look for the CLOSING delimiter (not the first one)
-                if i > 0 and line.strip() == delimiter and not found_closing:
-                    f.write(syndicated_line) # Insert valid syntax
-                    f.write(line)
-                    found_closing = True
-                else:
-                    f.write(line)
-                    
-        logging.info(f"💾 Updated syndicated status in {filepath}")
+                found_closing = False
+                for line in src:
+                    if line.strip() == delimiter:
+                        tmp.write(syndicated_line) # Insert valid syntax
+                        tmp.write(line)
+                        found_closing = True
+                        break
+                    tmp.write(line)
+
+                # Everything after the front matter is copied as-is
+                if found_closing:
+                    shutil.copyfileobj(src, tmp, 1 << 20)
+
+        if not found_closing:
+            os.remove(tmp_path)
+            logging.error("Error marking syndicated: no closing front matter delimiter in %s", filepath)
+            return False
+
+        shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+        logging.info("💾 Updated syndicated status in %s", filepath)
+        return True
     except Exception as e:
-        logging.error(f"Error marking syndicated: {e}")
+        logging.error("Error marking syndicated: %s", e)
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+
+def finish_item(item, results, dry_run, scan_cache):
+    """Marks a post as syndicated once every one of its sends has succeeded."""
+    title = item['frontmatter'].get('title', 'Unknown')
+    try:
+        results = [r.result() if isinstance(r, Future) else r for r in results]
+
+        if len(results) > 0 and all(results):
+            if dry_run:
+                print(f"ACTION: Would mark {os.path.basename(item['filepath'])} as syndicated.\n")
+            elif mark_syndicated(item):
+                scan_cache[item['filepath']] = {
+                    "mtime": os.stat(item['filepath']).st_mtime_ns,
+                    "syndicated": True,
+                    "syndicate_to": item['frontmatter'].get('syndicate_to', []),
+                }
+        elif not dry_run and len(results) > 0:
+            logging.warning("⚠️ Partial failure for %s. Not marking as syndicated.", title)
+    except Exception as e:
+        logging.error("Error marking syndicated: %s", e)
 
 def main():
     parser = argparse.ArgumentParser(description="Syndicate Hugo blog posts.")
     parser.add_argument("content_dir", help="The directory containing Hugo content.")
     parser.add_argument("--dry-run", action="store_true", help="Simulate syndication.")
     parser.add_argument("--force", action="store_true", help="Skip URL verification.")
+    parser.add_argument("--cache-file", default=SCAN_CACHE_FILE, help="Where to keep the scan cache.")
     args = parser.parse_args()
 
     # --- CLIENT INIT ---
@@ -238,85 +514,191 @@ def main():
                 bsky_client.login(BSKY_HANDLE, BSKY_PASSWORD)
                 logging.info("Connected to Bluesky.")
             except Exception as e:
-                logging.error(f"Bluesky Connection Error: {e}")
+                logging.error("Bluesky Connection Error: %s", e)
 
         if has_masto_creds:
             try:
                 masto_client = Mastodon(access_token=MASTODON_ACCESS_TOKEN, api_base_url=MASTODON_API_BASE)
                 logging.info("Connected to Mastodon.")
             except Exception as e:
-                logging.error(f"Mastodon Connection Error: {e}")
+                logging.error("Mastodon Connection Error: %s", e)
     else:
         logging.info("--- DRY RUN MODE ACTIVE ---")
 
+    # Normalize once here so every scanned path comes out normalized
+    content_dir = os.path.normpath(args.content_dir)
+
     manifest = []
+    old_cache = load_scan_cache(args.cache_file)
+    scan_cache = {}
+    read_buffer = bytearray(FRONTMATTER_READ_SIZE)
     
     # --- SCANNING ---
-    for root, dirs, files in os.walk(args.content_dir):
-        for file in files:
-            if file.endswith(".md"):
-                filepath = os.path.join(root, file)
-                try:
-                    with open(filepath, "r", encoding="utf-8") as f:
-                        content = f.read()
-                        fm = parse_frontmatter(content)
-                        
-                        if fm and "syndicate_to" in fm:
-                            if fm.get("syndicated", False):
-                                continue
-                            
-                            if not fm.get("microblog_content"):
-                                logging.warning(f"SKIPPED {file}: Missing 'microblog_content'.")
-                                continue
-                                
-                            manifest.append({"frontmatter": fm, "filepath": filepath})
-                except Exception as e:
-                    logging.warning(f"Could not read {file}: {e}")
-
-    logging.info(f"Found {len(manifest)} post(s) ready to syndicate.")
+    for entry in iter_markdown_files(content_dir):
+        filepath = entry.path
+        file = entry.name
+        try:
+            mtime = entry.stat().st_mtime_ns
+
+            # Unchanged files that are done (or never opted in) aren't re-read
+            cached = old_cache.get(filepath)
+            if cached and cached.get("mtime") == mtime:
+                if cached.get("syndicated") or not cached.get("syndicate_to"):
+                    scan_cache[filepath] = cached
+                    continue
+
+            content = read_frontmatter_block(filepath, read_buffer)
+            fm = None
+            syndicated = False
+
+            # Cheap text checks first, so most posts never hit the parser
+            if content and b"syndicate_to" in content:
+                syndicated = SYNDICATED_PATTERN.search(content) is not None
+                if not syndicated:
+                    fm = parse_frontmatter(content)
+
+            if fm:
+                syndicated = bool(fm.get("syndicated", False))
+
+            scan_cache[filepath] = {
+                "mtime": mtime,
+                "syndicated": syndicated,
+                "syndicate_to": fm.get("syndicate_to", []) if fm else [],
+            }
+            
+            if fm and "syndicate_to" in fm:
+                if syndicated:
+                    continue
+                
+                if not fm.get("microblog_content"):
+                    logging.warning("SKIPPED %s: Missing 'microblog_content'.", file)
+                    continue
+                    
+                manifest.append({
+                    "frontmatter": fm,
+                    "filepath": filepath,
+                    "fmt": "toml" if content.startswith(b"+++") else "yaml",
+                })
+        except Exception as e:
+            logging.warning("Could not read %s: %s", file, e)
+
+    logging.info("Found %s post(s) ready to syndicate.", len(manifest))
 
     # --- PROCESSING ---
     for item in manifest:
-        title = item['frontmatter'].get('title', 'Unknown')
-        url = get_post_url(item['filepath'], item['frontmatter'])
-        targets = item['frontmatter'].get('syndicate_to', [])
-        
-        # 1. URL VERIFICATION
-        if not args.dry_run and not args.force:
-            logging.info(f"Verifying URL: {url}")
-            if not verify_url_accessible(url):
-                logging.critical(f"STOPPING: URL {url} is not accessible.")
-                continue
-
-        # 2. EXECUTION
-        results = []
-        
-        if "bluesky" in targets:
-            if args.dry_run:
-                print(f"[Bluesky Dry Run] {title} -> {url}")
-                results.append(True)
-            elif bsky_client:
-                results.append(syndicate_to_bluesky(bsky_client, item['frontmatter'], url))
+        item['url'] = get_post_url(item['filepath'], item['frontmatter'])
+
+    # 1. URL VERIFICATION
+    # Checks are independent, so they run concurrently
+    if not args.dry_run and not args.force:
+        for item in manifest:
+            logging.info("Verifying URL: %s", item['url'])
+        with ThreadPoolExecutor(max_workers=VERIFY_WORKERS) as pool:
+            accessible = list(pool.map(verify_url_accessible, [item['url'] for item in manifest]))
+
+        ready = []
+        for item, ok in zip(manifest, accessible):
+            if ok:
+                ready.append(item)
             else:
-                results.append(False)
+                logging.critical("STOPPING: URL %s is not accessible.", item['url'])
+    else:
+        ready = manifest
+
+    # 2. EXECUTION
+    # Each network gets a single worker: posts go out in manifest order and
+    # neither client is shared across threads, but the two networks overlap.
+    # 3. MARK SYNDICATED
+    # Each post is marked as soon as its own sends finish, so an interrupted
+    # run never leaves a sent post unmarked behind slower ones.
+    jobs = []
+    bsky_queue = []
+    bsky_pool = ThreadPoolExecutor(max_workers=1)
+    masto_pool = ThreadPoolExecutor(max_workers=1)
+    try:
+        for item in ready:
+            title = item['frontmatter'].get('title', 'Unknown')
+            results = []
+            queued = False
 
-        if "mastodon" in targets:
-            if args.dry_run:
-                print(f"[Mastodon Dry Run] {title} -> {url}")
-                results.append(True)
-            elif masto_client:
-                results.append(syndicate_to_mastodon(masto_client, item['frontmatter'], url))
-            else:
+            try:
+                url = item['url']
+                targets = item['frontmatter'].get('syndicate_to', [])
+                post = None
+
+                if not args.dry_run:
+                    try:
+                        post = prepare_post(item['frontmatter'], url)
+                    except Exception as e:
+                        logging.error("❌ Could not prepare '%s': %s", title, e)
+                        results.append(False)
+                        targets = []
+                
+                if "bluesky" in targets:
+                    if args.dry_run:
+                        print(f"[Bluesky Dry Run] {title} -> {url}")
+                        results.append(True)
+                    elif bsky_client:
+                        try:
+                            record = build_bluesky_post(bsky_client, post, url)
+                            bsky_queue.append((results, title, record))
+                            queued = True
+                        except Exception as e:
+                            logging.error("❌ Bluesky Failed: %s", e)
+                            results.append(False)
+                    else:
+                        results.append(False)
+
+                if "mastodon" in targets:
+                    if args.dry_run:
+                        print(f"[Mastodon Dry Run] {title} -> {url}")
+                        results.append(True)
+                    elif masto_client:
+                        results.append(masto_pool.submit(syndicate_to_mastodon, masto_client, post))
+                    else:
+                        results.append(False)
+            except Exception as e:
+                logging.error("❌ Could not syndicate '%s': %s", title, e)
                 results.append(False)
 
-        # 3. MARK SYNDICATED
-        if len(results) > 0 and all(results):
-            if args.dry_run:
-                print(f"ACTION: Would mark {os.path.basename(item['filepath'])} as syndicated.\n")
+            # Nothing in flight: settle it now
+            if queued or any(isinstance(r, Future) for r in results):
+                jobs.append((item, results))
             else:
-                mark_syndicated(item)
-        elif not args.dry_run and len(results) > 0:
-            logging.warning(f"⚠️ Partial failure for {title}. Not marking as syndicated.")
+                finish_item(item, results, args.dry_run, scan_cache)
+
+        # Queued Bluesky posts go out in batches, one round trip per batch
+        for i in range(0, len(bsky_queue), BSKY_BATCH_SIZE):
+            batch = bsky_queue[i:i + BSKY_BATCH_SIZE]
+            future = bsky_pool.submit(syndicate_to_bluesky, bsky_client, [(title, record) for _, title, record in batch])
+            for (results, _, _), item_future in zip(batch, split_batch_future(future, len(batch))):
+                results.append(item_future)
+
+        # Map each in-flight send back to the posts waiting on it
+        remaining = [sum(isinstance(r, Future) for r in results) for _, results in jobs]
+        waiting = {}
+        for i, (_, results) in enumerate(jobs):
+            for r in results:
+                if isinstance(r, Future):
+                    waiting.setdefault(r, []).append(i)
+
+        for future in as_completed(waiting):
+            for i in waiting[future]:
+                remaining[i] -= 1
+                if remaining[i] == 0:
+                    finish_item(*jobs[i], args.dry_run, scan_cache)
+    except BaseException:
+        # Don't send anything else that can't be marked afterwards
+        bsky_pool.shutdown(cancel_futures=True)
+        masto_pool.shutdown(cancel_futures=True)
+        raise
+    finally:
+        bsky_pool.shutdown()
+        masto_pool.shutdown()
+
+    # Dry runs leave every file alone, the cache included
+    if not args.dry_run:
+        save_scan_cache(args.cache_file, scan_cache)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file